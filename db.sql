@@ -9,7 +9,7 @@ DROP TABLE IF EXISTS users CASCADE;
 DROP FUNCTION IF EXISTS update_updated_at_column;
 
 CREATE TABLE users (
-id SERIAL PRIMARY KEY,
+id BIGSERIAL PRIMARY KEY,
 username VARCHAR(50) UNIQUE NOT NULL,
 email VARCHAR(100) UNIQUE NOT NULL,
 password_hash TEXT NOT NULL, 
@@ -22,9 +22,9 @@ CREATE INDEX idx_users_email ON users (email);
 
 
 CREATE TABLE posts (
-id SERIAL PRIMARY KEY,
+id BIGSERIAL PRIMARY KEY,
 
-user_id INTEGER NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+user_id BIGINT NOT NULL REFERENCES users(id) ON DELETE CASCADE,
 title VARCHAR(255) NOT NULL,
 content TEXT NOT NULL,
 is_anonymous BOOLEAN DEFAULT FALSE, 
@@ -38,23 +38,24 @@ CREATE INDEX idx_posts_created_at ON posts (created_at DESC);
 
 
 CREATE TABLE comments (
-id SERIAL PRIMARY KEY,
+id BIGSERIAL PRIMARY KEY,
 
-post_id INTEGER NOT NULL REFERENCES posts(id) ON DELETE CASCADE,
+post_id BIGINT NOT NULL REFERENCES posts(id) ON DELETE CASCADE,
 
-user_id INTEGER NOT NULL REFERENCES users(id) ON DELETE CASCADE,
-content TEXT NOT NULL,
+user_id BIGINT NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+content VARCHAR(2000) NOT NULL,
 is_anonymous BOOLEAN DEFAULT FALSE,
 created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
 );
 
 CREATE INDEX idx_comments_post_id ON comments (post_id);
 CREATE INDEX idx_comments_user_id ON comments (user_id);
+CREATE INDEX idx_comments_post_created ON comments (post_id, created_at);
 
 
 CREATE TABLE mood_entries (
-id SERIAL PRIMARY KEY,
-user_id INTEGER NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+id BIGSERIAL PRIMARY KEY,
+user_id BIGINT NOT NULL REFERENCES users(id) ON DELETE CASCADE,
 mood_score INTEGER NOT NULL CHECK (mood_score BETWEEN 1 AND 10), 
 notes TEXT,
 entry_date DATE DEFAULT CURRENT_DATE,
@@ -63,25 +64,30 @@ created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
 
 
 CREATE UNIQUE INDEX uidx_moods_user_date ON mood_entries (user_id, entry_date);
+CREATE INDEX idx_mood_user_date ON mood_entries (user_id, entry_date DESC);
 
 
 CREATE TABLE chat_sessions (
-id SERIAL PRIMARY KEY,
-user_id INTEGER NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+id BIGSERIAL PRIMARY KEY,
+user_id BIGINT NOT NULL REFERENCES users(id) ON DELETE CASCADE,
 topic VARCHAR(100), 
 session_start TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
 session_end TIMESTAMP WITH TIME ZONE,
 
-full_log_content TEXT,
+full_log_content JSONB,
 
-ai_summary TEXT
+ai_summary VARCHAR(500)
 );
 
+-- lz4 is much faster than the default pglz for large chat logs (PG14+)
+ALTER TABLE chat_sessions ALTER COLUMN full_log_content SET COMPRESSION lz4;
+
 CREATE INDEX idx_chats_user_id ON chat_sessions (user_id);
+CREATE INDEX idx_chat_user_start ON chat_sessions (user_id, session_start);
 
 
 CREATE TABLE resources (
-id SERIAL PRIMARY KEY,
+id BIGSERIAL PRIMARY KEY,
 name VARCHAR(255) NOT NULL,
 resource_type VARCHAR(50) NOT NULL, 
 contact_info VARCHAR(255),
@@ -92,6 +98,7 @@ created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
 );
 
 CREATE INDEX idx_resources_type ON resources (resource_type);
+CREATE INDEX idx_resources_verified ON resources (is_verified) WHERE is_verified = true;
 
 
 CREATE OR REPLACE FUNCTION update_updated_at_column()